@@ -1,5 +1,8 @@
 import re
 
+_ENV_VAR_PATTERN = re.compile(r"\A[A-Za-z_]\w*\Z", re.ASCII)
+_ENV_VAR_MATCH = _ENV_VAR_PATTERN.match
+
 
 def is_valid_env_var(var_name: str) -> bool:
-    return bool(re.match("^[a-zA-Z_][a-zA-Z0-9_]*$", var_name))
+    return bool(_ENV_VAR_MATCH(var_name))
@@ -8,6 +8,9 @@ from .ast import Comment
 if TYPE_CHECKING:
     from .ast import Line, ParseConfig
 
+# Any glob pattern includes at least one of these chars
+_GLOB_CHARS = frozenset("*?[")
+
 
 def parse_poe_cmd(source: str, config: Optional["ParseConfig"] = None):
     from .ast import Glob, ParseConfig, ParseCursor, PythonGlob, Script
@@ -115,7 +118,11 @@ def resolve_command_tokens(
                                 yield finalize_token(token_parts)
 
                             param_words = (
-                                (word, bool(glob_pattern.search(word)))
+                                (
+                                    word,
+                                    not _GLOB_CHARS.isdisjoint(word)
+                                    and bool(glob_pattern.search(word)),
+                                )
                                 for word in param_value.split()
                             )
 
@@ -41,7 +41,7 @@ class ParseCursor:
 
     @classmethod
     def from_string(cls, string: str):
-        return cls(char for char in string)
+        return cls(iter(string))
 
     @property
     def position(self):
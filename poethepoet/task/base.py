@@ -1,8 +1,10 @@
 import re
+import string
 import sys
 from collections.abc import Iterator, Mapping, Sequence
 from os import environ
 from pathlib import Path
+from shlex import split as _shlex_split
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, Optional, Union
 
 from ..config.primitives import EmptyDict, EnvDefault
@@ -17,27 +19,10 @@ if TYPE_CHECKING:
     from .args import PoeTaskArgs
 
 
-_TASK_NAME_PATTERN = re.compile(r"^\w[\w\d\-\_\+\:]*$")
-
-
-class MetaPoeTask(type):
-    """
-    This metaclass makes all descendents of PoeTask (task types) register themselves on
-    declaration and validates that they include the expected class attributes.
-    """
-
-    def __init__(cls, *args):
-        super().__init__(*args)
-        if cls.__name__ == "PoeTask":
-            return
-
-        assert isinstance(getattr(cls, "__key__", None), str)
-        assert issubclass(getattr(cls, "TaskOptions", None), PoeOptions)
-        PoeTask._PoeTask__task_types[cls.__key__] = cls
-
-        # Give each TaskSpec a reference to its parent PoeTask
-        if "TaskSpec" in cls.__dict__:
-            cls.TaskSpec.task_type = cls
+_TASK_NAME_PATTERN = re.compile(r"\A\w[\w\-\+\:]*\Z")
+_TASK_NAME_MATCH = _TASK_NAME_PATTERN.match
+_IDENT_START = frozenset(string.ascii_letters + "_")
+_IS_WINDOWS = sys.platform == "win32"
 
 
 TaskContent = Union[str, Sequence[Union[str, Mapping[str, Any]]]]
@@ -46,6 +31,8 @@ TaskDef = Union[str, Mapping[str, Any], Sequence[Union[str, Mapping[str, Any]]]]
 
 
 class TaskSpecFactory:
+    __slots__ = ("__cache", "config")
+
     __cache: dict[str, "PoeTask.TaskSpec"]
     config: "PoeConfig"
 
@@ -72,10 +59,11 @@ class TaskSpecFactory:
                 task_name, task_type, task_def, source=parent.source, parent=parent
             )
 
-        if task_name not in self.__cache:
+        if (cached := self.__cache.get(task_name)) is None:
             self.load(task_name)
+            return self.__cache[task_name]
 
-        return self.__cache[task_name]
+        return cached
 
     def create(
         self,
@@ -102,7 +90,8 @@ class TaskSpecFactory:
 
     def load_all(self):
         for task_name in self.config.task_names:
-            self.load(task_name)
+            if task_name not in self.__cache:
+                self.load(task_name)
 
         return self
 
@@ -117,7 +106,7 @@ class TaskSpecFactory:
             raise ConfigValidationError(
                 "Task definition must be a string, a list, or a table including exactly"
                 " one task key\n"
-                f"Available task keys: {set(PoeTask.get_task_types())!r}",
+                f"Available task keys: {PoeTask.get_task_types()!r}",
                 task_name=task_name,
                 filename=(
                     None if config_partition.is_primary else str(config_partition.path)
@@ -152,7 +141,7 @@ class TaskContext(NamedTuple):
         )
 
 
-class PoeTask(metaclass=MetaPoeTask):
+class PoeTask:
     __key__: ClassVar[str]
     __content_type__: ClassVar[type] = str
 
@@ -174,14 +163,27 @@ class PoeTask(metaclass=MetaPoeTask):
             """
 
     class TaskSpec:
+        __slots__ = (
+            "_args",
+            "content",
+            "has_args",
+            "has_deps",
+            "name",
+            "options",
+            "parent",
+            "source",
+        )
+
         name: str
         content: TaskContent
         options: "PoeTask.TaskOptions"
-        task_type: type["PoeTask"]
+        task_type: ClassVar[type["PoeTask"]]
         source: "ConfigPartition"
-        parent: Optional["PoeTask.TaskSpec"] = None
+        parent: Optional["PoeTask.TaskSpec"]
+        has_args: bool
+        has_deps: bool
 
-        _args: Optional["PoeTaskArgs"] = None
+        _args: Optional["PoeTaskArgs"]
 
         def __init__(
             self,
@@ -194,8 +196,11 @@ class PoeTask(metaclass=MetaPoeTask):
             self.name = name
             self.content = task_def[self.task_type.__key__]
             self.options = self._parse_options(task_def)
+            self.has_args = bool(self.options.args)
+            self.has_deps = bool(self.options.deps or self.options.uses)
             self.source = source
             self.parent = parent
+            self._args = None
 
         def _parse_options(self, task_def: dict[str, Any]):
             try:
@@ -269,12 +274,13 @@ class PoeTask(metaclass=MetaPoeTask):
             """
             Perform validations on this TaskSpec that apply to all task types
             """
-            if not (self.name[0].isalpha() or self.name[0] == "_"):
+            start_char = self.name[:1]
+            if start_char not in _IDENT_START and not start_char.isalpha():
                 raise ConfigValidationError(
                     "Task names must start with a letter or underscore."
                 )
 
-            if not self.parent and not _TASK_NAME_PATTERN.match(self.name):
+            if not self.parent and not _TASK_NAME_MATCH(self.name):
                 raise ConfigValidationError(
                     "Task names characters must be alphanumeric, colon, underscore or "
                     "dash."
@@ -288,7 +294,8 @@ class PoeTask(metaclass=MetaPoeTask):
 
             if self.options.deps:
                 for dep in self.options.deps:
-                    dep_task_name = dep.split(" ", 1)[0]
+                    space_index = dep.find(" ")
+                    dep_task_name = dep if space_index < 0 else dep[:space_index]
                     if dep_task_name not in task_specs:
                         raise ConfigValidationError(
                             "'deps' option includes reference to unknown task: "
@@ -310,7 +317,8 @@ class PoeTask(metaclass=MetaPoeTask):
                             f"'uses' option includes invalid key: {key!r}"
                         )
 
-                    dep_task_name = dep.split(" ", 1)[0]
+                    space_index = dep.find(" ")
+                    dep_task_name = dep if space_index < 0 else dep[:space_index]
                     if dep_task_name not in task_specs:
                         raise ConfigValidationError(
                             "'uses' options includes reference to unknown task: "
@@ -334,14 +342,32 @@ class PoeTask(metaclass=MetaPoeTask):
             Perform validations on this TaskSpec that apply to a specific task type
             """
 
+    __slots__ = (
+        "__dep_ctx",
+        "__upstream_invocations",
+        "__working_dir",
+        "_parsed_args",
+        "capture_stdout",
+        "ctx",
+        "invocation",
+        "spec",
+    )
+
     spec: TaskSpec
+    invocation: tuple[str, ...]
     ctx: TaskContext
-    _parsed_args: Optional[tuple[dict[str, str], tuple[str, ...]]] = None
+    capture_stdout: Union[str, bool]
+    _parsed_args: Optional[tuple[dict[str, str], tuple[str, ...]]]
+    _is_windows: ClassVar[bool] = _IS_WINDOWS
 
     __task_types: ClassVar[dict[str, type["PoeTask"]]] = {}
+    __task_type_cache: ClassVar[dict[frozenset[str], str]] = {}
+    __task_types_cache: ClassVar[dict[Optional[type], tuple[str, ...]]] = {}
     __upstream_invocations: Optional[
         dict[str, Union[list[tuple[str, ...]], dict[str, tuple[str, ...]]]]
-    ] = None
+    ]
+    __dep_ctx: Optional[TaskContext]
+    __working_dir: Optional[Path]
 
     def __init__(
         self,
@@ -354,7 +380,27 @@ class PoeTask(metaclass=MetaPoeTask):
         self.invocation = invocation
         self.ctx = ctx
         self.capture_stdout = spec.options.capture_stdout or capture_stdout
-        self._is_windows = sys.platform == "win32"
+        self._parsed_args = None
+        self.__upstream_invocations = None
+        self.__dep_ctx = None
+        self.__working_dir = None
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Make all descendents of PoeTask (task types) register themselves on declaration
+        and validate that they include the expected class attributes.
+        """
+        super().__init_subclass__(**kwargs)
+
+        assert isinstance(getattr(cls, "__key__", None), str)
+        assert issubclass(getattr(cls, "TaskOptions", None), PoeOptions)
+        PoeTask.__task_types[cls.__key__] = cls
+        PoeTask.__task_type_cache.clear()
+        PoeTask.__task_types_cache.clear()
+
+        # Give each TaskSpec a reference to its parent PoeTask
+        if "TaskSpec" in cls.__dict__:
+            cls.TaskSpec.task_type = cls
 
     @property
     def name(self):
@@ -382,9 +428,21 @@ class PoeTask(metaclass=MetaPoeTask):
                 return config.default_task_type
 
         elif isinstance(task_def, dict):
-            task_type_keys = set(task_def.keys()).intersection(cls.__task_types)
-            if len(task_type_keys) == 1:
-                return next(iter(task_type_keys))
+            keys = frozenset(task_def)
+            if cached := cls.__task_type_cache.get(keys):
+                return cached
+
+            task_type: Optional[str] = None
+            for key in task_def:
+                if key in cls.__task_types:
+                    if task_type is not None:
+                        # Ambiguous task definition
+                        return None
+                    task_type = key
+
+            if task_type is not None:
+                cls.__task_type_cache[keys] = task_type
+            return task_type
 
         elif isinstance(task_def, list):
             return config.default_array_task_type
@@ -433,7 +491,8 @@ class PoeTask(metaclass=MetaPoeTask):
         Run this task
         """
 
-        if environ.get("POE_DEBUG"):
+        debug = bool(environ.get("POE_DEBUG"))
+        if debug:
             task_type_key = self.__key__  # type: ignore[attr-defined]
             print(f" * Running     {task_type_key}:{self.name}")
             print(f" . Invocation  {self.invocation!r}")
@@ -456,7 +515,7 @@ class PoeTask(metaclass=MetaPoeTask):
             context._get_dep_values(upstream_invocations["uses"]),
         )
 
-        if environ.get("POE_DEBUG"):
+        if debug:
             named_arg_values, extra_args = self.get_parsed_arguments(task_env)
             print(f" . Parsed args {named_arg_values!r}")
             print(f" . Extra args  {extra_args!r}")
@@ -494,12 +553,22 @@ class PoeTask(metaclass=MetaPoeTask):
         self,
         env: "EnvVarsManager",
     ) -> Path:
-        cwd_option = env.fill_template(self.spec.options.get("cwd", self.ctx.cwd))
-        working_dir = Path(cwd_option)
+        cwd_option = self.spec.options.get("cwd", self.ctx.cwd)
+        is_templated = "$" in cwd_option
+        if not is_templated and self.__working_dir is not None:
+            return self.__working_dir
+
+        working_dir = Path(
+            env.fill_template(cwd_option) if is_templated else cwd_option
+        )
 
         if not working_dir.is_absolute():
             working_dir = self.ctx.config.project_dir / working_dir
 
+        if not is_templated:
+            # Only a cwd that doesn't depend on the env can be reused
+            self.__working_dir = working_dir
+
         return working_dir
 
     def iter_upstream_tasks(
@@ -518,45 +587,48 @@ class PoeTask(metaclass=MetaPoeTask):
         for all current usecases is it strictly speaking something that this object
         should not know enough to safely assume. So we probably want to revisit this.
         """
-        import shlex
-
-        options = self.spec.options
-
         if self.__upstream_invocations is None:
+            options = self.spec.options
             env = self.spec.get_task_env(context.env)
             env.update(self.get_parsed_arguments(env)[0])
+            fill_template = env.fill_template
+
+            deps: list[tuple[str, ...]] = []
+            for task_ref in options.get("deps") or tuple():
+                if "$" in task_ref:
+                    task_ref = fill_template(task_ref)
+                deps.append(tuple(_shlex_split(task_ref)))
 
-            self.__upstream_invocations = {
-                "deps": [
-                    tuple(shlex.split(env.fill_template(task_ref)))
-                    for task_ref in options.get("deps", tuple())
-                ],
-                "uses": {
-                    key: tuple(shlex.split(env.fill_template(task_ref)))
-                    for key, task_ref in options.get("uses", {}).items()
-                },
-            }
+            uses: dict[str, tuple[str, ...]] = {}
+            for key, task_ref in (options.get("uses") or {}).items():
+                if "$" in task_ref:
+                    task_ref = fill_template(task_ref)
+                uses[key] = tuple(_shlex_split(task_ref))
+
+            self.__upstream_invocations = {"deps": deps, "uses": uses}
 
         return self.__upstream_invocations
 
     def _instantiate_dep(
         self, invocation: tuple[str, ...], capture_stdout: bool
     ) -> "PoeTask":
-        return self.ctx.specs.get(invocation[0]).create_task(
-            invocation=invocation,
-            ctx=TaskContext(
+        if self.__dep_ctx is None:
+            # All deps of this task share the same context
+            self.__dep_ctx = TaskContext(
                 config=self.ctx.config,
                 cwd=str(self.ctx.config.project_dir),
                 specs=self.ctx.specs,
                 ui=self.ctx.ui,
-            ),
+            )
+
+        return self.ctx.specs.get(invocation[0]).create_task(
+            invocation=invocation,
+            ctx=self.__dep_ctx,
             capture_stdout=capture_stdout,
         )
 
     def has_deps(self) -> bool:
-        return bool(
-            self.spec.options.get("deps", False) or self.spec.options.get("uses", False)
-        )
+        return self.spec.has_deps
 
     @classmethod
     def is_task_type(
@@ -567,20 +639,28 @@ class PoeTask(metaclass=MetaPoeTask):
         Optionally also check whether the given content_type matches the type of content
         for this tasks type.
         """
-        return task_def_key in cls.__task_types and (
+        task_types = cls.__task_types
+        return task_def_key in task_types and (
             content_type is None
-            or cls.__task_types[task_def_key].__content_type__ is content_type
+            or task_types[task_def_key].__content_type__ is content_type
         )
 
     @classmethod
     def get_task_types(cls, content_type: Optional[type] = None) -> tuple[str, ...]:
+        if (cached := cls.__task_types_cache.get(content_type)) is not None:
+            return cached
+
         if content_type:
-            return tuple(
+            result = tuple(
                 task_type
                 for task_type, task_cls in cls.__task_types.items()
                 if task_cls.__content_type__ is content_type
             )
-        return tuple(task_type for task_type in cls.__task_types.keys())
+        else:
+            result = tuple(cls.__task_types)
+
+        cls.__task_types_cache[content_type] = result
+        return result
 
     def _print_action(self, action: str, dry: bool, unresolved: bool = False):
         """
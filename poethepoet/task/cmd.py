@@ -1,13 +1,14 @@
 import shlex
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional
 
 from ..exceptions import ConfigValidationError, PoeException
 from .base import PoeTask
 
 if TYPE_CHECKING:
-    from ..config import PoeConfig
+    from ..config import ConfigPartition, PoeConfig
     from ..context import RunContext
     from ..env.manager import EnvVarsManager
+    from ..helpers.command.ast import Line
     from .base import TaskSpecFactory
 
 
@@ -33,8 +34,33 @@ class CmdTask(PoeTask):
                 )
 
     class TaskSpec(PoeTask.TaskSpec):
+        __slots__ = ("_command_lines",)
+
         content: str
         options: "CmdTask.TaskOptions"
+        _command_lines: Optional[tuple["Line", ...]]
+
+        def __init__(
+            self,
+            name: str,
+            task_def: dict[str, Any],
+            factory: "TaskSpecFactory",
+            source: "ConfigPartition",
+            parent: Optional["PoeTask.TaskSpec"] = None,
+        ):
+            super().__init__(name, task_def, factory, source, parent)
+            self._command_lines = None
+
+        def get_command_lines(self) -> tuple["Line", ...]:
+            """
+            Parse the content of this task into command lines. The result doesn't
+            depend on the env so it is cached for subsequent runs of this task.
+            """
+            from ..helpers.command import parse_poe_cmd
+
+            if self._command_lines is None:
+                self._command_lines = parse_poe_cmd(self.content).command_lines
+            return self._command_lines
 
         def _task_validations(self, config: "PoeConfig", task_specs: "TaskSpecFactory"):
             """
@@ -43,6 +69,8 @@ class CmdTask(PoeTask):
             if not self.content.strip():
                 raise ConfigValidationError("Task has no content")
 
+    __slots__ = ()
+
     spec: TaskSpec
 
     def _handle_run(
@@ -62,11 +90,11 @@ class CmdTask(PoeTask):
         )
 
     def _resolve_commandline(self, context: "RunContext", env: "EnvVarsManager"):
-        from ..helpers.command import parse_poe_cmd, resolve_command_tokens
+        from ..helpers.command import resolve_command_tokens
         from ..helpers.command.ast_core import ParseError
 
         try:
-            command_lines = parse_poe_cmd(self.spec.content).command_lines
+            command_lines = self.spec.get_command_lines()
         except ParseError as error:
             raise PoeException(
                 f"Couldn't parse command line for task {self.name!r}", error
@@ -84,11 +112,17 @@ class CmdTask(PoeTask):
 
         working_dir = self.get_working_dir(env)
 
-        result = []
+        result: list[str] = []
+        glob_matches: dict[str, list[str]] = {}
         for cmd_token, has_glob in resolve_command_tokens(command_lines, env):
             if has_glob:
-                # Resolve glob pattern from the working directory
-                result.extend([str(match) for match in working_dir.glob(cmd_token)])
+                # Resolve glob pattern from the working directory, only once for
+                # patterns that are repeated in the command
+                if cmd_token not in glob_matches:
+                    glob_matches[cmd_token] = [
+                        str(match) for match in working_dir.glob(cmd_token)
+                    ]
+                result.extend(glob_matches[cmd_token])
             else:
                 result.append(cmd_token)
 
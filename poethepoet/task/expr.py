@@ -12,6 +12,10 @@ if TYPE_CHECKING:
     from .base import TaskSpecFactory
 
 
+_PADDED_LINE_BREAK_PATTERN = re.compile(r"((\r\n|\r|\n) | (\r\n|\r|\n))")
+_LINE_BREAK_PATTERN = re.compile(r"(\r\n|\r|\n)")
+
+
 class ExprTask(PoeTask):
     """
     A task consisting of a python expression
@@ -35,6 +39,8 @@ class ExprTask(PoeTask):
                 )
 
     class TaskSpec(PoeTask.TaskSpec):
+        __slots__ = ()
+
         content: str
         options: "ExprTask.TaskOptions"
 
@@ -48,6 +54,8 @@ class ExprTask(PoeTask):
             except (ValueError, ExpressionParseError) as error:
                 raise ConfigValidationError(f"Invalid expression: {error}")
 
+    __slots__ = ()
+
     spec: TaskSpec
 
     def _handle_run(
@@ -65,7 +73,10 @@ class ExprTask(PoeTask):
         expr, env_values = self.parse_content(named_arg_values, env, imports)
         argv = [
             self.spec.name,
-            *(env.fill_template(token) for token in self.invocation[1:]),
+            *(
+                env.fill_template(token) if "$" in token else token
+                for token in self.invocation[1:]
+            ),
         ]
 
         script = [
@@ -118,8 +129,9 @@ class ExprTask(PoeTask):
             allowed_vars={"sys", "__env", *imports},
         )
         # Strip out any new lines because they can be problematic on windows
-        expression = re.sub(r"((\r\n|\r|\n) | (\r\n|\r|\n))", " ", expression)
-        expression = re.sub(r"(\r\n|\r|\n)", " ", expression)
+        if "\n" in expression or "\r" in expression:
+            expression = _PADDED_LINE_BREAK_PATTERN.sub(" ", expression)
+            expression = _LINE_BREAK_PATTERN.sub(" ", expression)
 
         return expression, accessed_vars
 
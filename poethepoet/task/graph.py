@@ -8,6 +8,14 @@ if TYPE_CHECKING:
 
 
 class TaskExecutionNode:
+    __slots__ = (
+        "capture_stdout",
+        "direct_dependants",
+        "direct_dependencies",
+        "path_dependants",
+        "task",
+    )
+
     task: "PoeTask"
     direct_dependants: list["TaskExecutionNode"]
     direct_dependencies: set[tuple[str, ...]]
@@ -74,22 +82,31 @@ class TaskExecutionGraph:
         #       scheduling
 
         stages: list[list[TaskExecutionNode]] = [self.sources]
-        visited = {source.identifier for source in self.sources}
+        visited: set[tuple[str, ...]] = set()
+        # Track how many direct dependencies of each node have yet to be added, so
+        # readiness can be checked without comparing sets of dependencies
+        pending_deps = {
+            node: len(node.direct_dependencies)
+            for node in (
+                self.sink,
+                *self.captured_tasks.values(),
+                *self.uncaptured_tasks.values(),
+            )
+        }
+        for source in self.sources:
+            self._mark_visited(source.identifier, visited, pending_deps)
 
         while True:
             next_stage = []
             for node in stages[-1]:
                 for dep_node in node.direct_dependants:
-                    if (
-                        dep_node.identifier in visited
-                        or not dep_node.direct_dependencies.issubset(visited)
-                    ):
+                    if dep_node.identifier in visited or pending_deps[dep_node]:
                         # We've already added this node OR some dependencies of dep_node
                         # have not been added so we can't add it yet
                         continue
 
                     next_stage.append(dep_node)
-                    visited.add(dep_node.identifier)
+                    self._mark_visited(dep_node.identifier, visited, pending_deps)
 
             if not next_stage:
                 break
@@ -98,47 +115,91 @@ class TaskExecutionGraph:
 
         return [[node.task for node in stage] for stage in stages]
 
+    def _mark_visited(
+        self,
+        identifier: tuple[str, ...],
+        visited: set[tuple[str, ...]],
+        pending_deps: dict[TaskExecutionNode, int],
+    ):
+        """
+        Record that the task with the given identifier has been added to the execution
+        plan, and count it off the pending dependencies of every node that depends on
+        it, whether via its captured or uncaptured node.
+        """
+        if identifier in visited:
+            return
+        visited.add(identifier)
+
+        dependants: set[TaskExecutionNode] = set()
+        for node in (
+            self.captured_tasks.get(identifier),
+            self.uncaptured_tasks.get(identifier),
+        ):
+            if node is not None:
+                dependants.update(node.direct_dependants)
+        for dependant in dependants:
+            pending_deps[dependant] -= 1
+
     def _resolve_node_deps(self, node: TaskExecutionNode):
         """
         Build a DAG of tasks by depth-first traversal of the dependency tree starting
         from the sink node.
-        """
-        for key, task in node.task.iter_upstream_tasks(self._context):
-            node.direct_dependencies.add(task.invocation)
 
-            if task.invocation in node.path_dependants:
-                raise CyclicDependencyError(
-                    f"Encountered cyclic task dependency with task: {task.name!r}"
-                )
-
-            # a non empty key indicates output is captured
-            capture_stdout = bool(key)
-
-            # Check if a node already exists for this task
-            if capture_stdout:
-                if task.invocation in self.captured_tasks:
-                    # reuse instance of task with captured output
-                    self.captured_tasks[task.invocation].direct_dependants.append(node)
+        The traversal uses an explicit stack of partially consumed upstream task
+        iterators rather than recursion, so deep dependency chains are not limited by
+        the interpreter's recursion limit, while nodes are still visited in the same
+        order.
+        """
+        stack = [(node, node.task.iter_upstream_tasks(self._context))]
+        while stack:
+            node, upstream_tasks = stack[-1]
+            for key, task in upstream_tasks:
+                node.direct_dependencies.add(task.invocation)
+
+                if task.invocation in node.path_dependants:
+                    raise CyclicDependencyError(
+                        f"Encountered cyclic task dependency with task: {task.name!r}"
+                    )
+
+                # a non empty key indicates output is captured
+                capture_stdout = bool(key)
+
+                # Check if a node already exists for this task
+                if capture_stdout:
+                    if task.invocation in self.captured_tasks:
+                        # reuse instance of task with captured output
+                        self.captured_tasks[task.invocation].direct_dependants.append(
+                            node
+                        )
+                        continue
+                elif task.invocation in self.uncaptured_tasks:
+                    # reuse instance of task with uncaptured output
+                    self.uncaptured_tasks[task.invocation].direct_dependants.append(
+                        node
+                    )
                     continue
-            elif task.invocation in self.uncaptured_tasks:
-                # reuse instance of task with uncaptured output
-                self.uncaptured_tasks[task.invocation].direct_dependants.append(node)
-                continue
-
-            # This task has not been encountered before via another path
-            new_node = TaskExecutionNode(
-                task, [node], node.path_dependants, capture_stdout
-            )
 
-            # Keep track of this task/node so it can be found by other dependants
-            if capture_stdout:
-                self.captured_tasks[task.invocation] = new_node
-            else:
-                self.uncaptured_tasks[task.invocation] = new_node
+                # This task has not been encountered before via another path
+                new_node = TaskExecutionNode(
+                    task, [node], node.path_dependants, capture_stdout
+                )
 
-            if new_node.is_source():
-                # Track this node as having no dependencies
-                self.sources.append(new_node)
+                # Keep track of this task/node so it can be found by other dependants
+                if capture_stdout:
+                    self.captured_tasks[task.invocation] = new_node
+                else:
+                    self.uncaptured_tasks[task.invocation] = new_node
+
+                if new_node.is_source():
+                    # Track this node as having no dependencies
+                    self.sources.append(new_node)
+                else:
+                    # Descend immediately for DFS, resuming this node's remaining
+                    # upstream tasks once the new node is fully resolved
+                    stack.append(
+                        (new_node, new_node.task.iter_upstream_tasks(self._context))
+                    )
+                    break
             else:
-                # Recurse immediately for DFS
-                self._resolve_node_deps(new_node)
+                # All upstream tasks of this node have been resolved
+                stack.pop()
@@ -1,10 +1,13 @@
-from typing import TYPE_CHECKING
+import shlex
+from typing import TYPE_CHECKING, Any, Optional
 
 from ..exceptions import ConfigValidationError
 from .base import PoeTask, TaskContext
 
 if TYPE_CHECKING:
-    from ..config import PoeConfig
+    from collections.abc import Iterable
+
+    from ..config import ConfigPartition, PoeConfig
     from ..context import RunContext
     from ..env.manager import EnvVarsManager
     from .base import TaskSpecFactory
@@ -32,17 +35,38 @@ class RefTask(PoeTask):
                 )
 
     class TaskSpec(PoeTask.TaskSpec):
+        __slots__ = ("_content_tokens",)
+
         content: str
         options: "RefTask.TaskOptions"
+        _content_tokens: Optional[tuple[str, ...]]
+
+        def __init__(
+            self,
+            name: str,
+            task_def: dict[str, Any],
+            factory: "TaskSpecFactory",
+            source: "ConfigPartition",
+            parent: Optional["PoeTask.TaskSpec"] = None,
+        ):
+            super().__init__(name, task_def, factory, source, parent)
+            self._content_tokens = None
+
+        def get_content_tokens(self) -> tuple[str, ...]:
+            """
+            Split the content of this task into tokens without resolving templates.
+            The result is cached for subsequent runs of this task.
+            """
+            if self._content_tokens is None:
+                self._content_tokens = tuple(shlex.split(self.content))
+            return self._content_tokens
 
         def _task_validations(self, config: "PoeConfig", task_specs: "TaskSpecFactory"):
             """
             Perform validations on this TaskSpec that apply to a specific task type
             """
 
-            import shlex
-
-            task_name_ref = shlex.split(self.content)[0]
+            task_name_ref = self.get_content_tokens()[0]
 
             if task_name_ref not in task_specs:
                 raise ConfigValidationError(
@@ -55,6 +79,8 @@ class RefTask(PoeTask):
                     f"'use_exec' set to true: {task_name_ref!r}"
                 )
 
+    __slots__ = ()
+
     spec: TaskSpec
 
     def _handle_run(
@@ -65,18 +91,20 @@ class RefTask(PoeTask):
         """
         Lookup and delegate to the referenced task
         """
-        import shlex
-
         named_arg_values, extra_args = self.get_parsed_arguments(env)
         env.update(named_arg_values)
 
-        ref_invocation = (
-            *(
+        content = self.spec.content.strip()
+        if "$" in content:
+            ref_tokens: Iterable[str] = (
                 env.fill_template(token)
-                for token in shlex.split(env.fill_template(self.spec.content.strip()))
-            ),
-            *extra_args,
-        )
+                for token in shlex.split(env.fill_template(content))
+            )
+        else:
+            # Without templates the tokens don't depend on the env
+            ref_tokens = self.spec.get_content_tokens()
+
+        ref_invocation = (*ref_tokens, *extra_args)
 
         task = self.ctx.specs.get(ref_invocation[0]).create_task(
             invocation=ref_invocation, ctx=TaskContext.from_task(self)
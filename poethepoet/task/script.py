@@ -34,6 +34,8 @@ class ScriptTask(PoeTask):
                 )
 
     class TaskSpec(PoeTask.TaskSpec):
+        __slots__ = ()
+
         content: str
         options: "ScriptTask.TaskOptions"
 
@@ -53,6 +55,8 @@ class ScriptTask(PoeTask):
                     "(expected something like `module:callable` or `module:callable()`)"
                 )
 
+    __slots__ = ()
+
     spec: TaskSpec
 
     def _handle_run(
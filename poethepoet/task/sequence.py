@@ -43,6 +43,8 @@ class SequenceTask(PoeTask):
                 )
 
     class TaskSpec(PoeTask.TaskSpec):
+        __slots__ = ("subtasks",)
+
         content: list
         options: "SequenceTask.TaskOptions"
         subtasks: Sequence[PoeTask.TaskSpec]
@@ -97,13 +99,15 @@ class SequenceTask(PoeTask):
             Perform validations on this TaskSpec that apply to a specific task type
             """
             for index, subtask in enumerate(self.subtasks):
-                if subtask.args:
+                if subtask.has_args:
                     raise ConfigValidationError(
                         "Unsupported option 'args' for task declared inside sequence"
                     )
 
                 subtask.validate(config, task_specs)
 
+    __slots__ = ("subtasks",)
+
     spec: TaskSpec
 
     def __init__(
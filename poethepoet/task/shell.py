@@ -51,9 +51,13 @@ class ShellTask(PoeTask):
                         )
 
     class TaskSpec(PoeTask.TaskSpec):
+        __slots__ = ()
+
         content: str
         options: "ShellTask.TaskOptions"
 
+    __slots__ = ()
+
     spec: TaskSpec
 
     def _handle_run(
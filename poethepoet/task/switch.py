@@ -56,6 +56,8 @@ class SwitchTask(PoeTask):
             return super().normalize(config, strict)
 
     class TaskSpec(PoeTask.TaskSpec):
+        __slots__ = ("case_task_specs", "control_task_spec")
+
         control_task_spec: PoeTask.TaskSpec
         case_task_specs: tuple[tuple[tuple[Any, ...], PoeTask.TaskSpec], ...]
         options: "SwitchTask.TaskOptions"
@@ -143,6 +145,8 @@ class SwitchTask(PoeTask):
             for _, case_task_spec in self.case_task_specs:
                 case_task_spec.validate(config, task_specs)
 
+    __slots__ = ("control_task", "switch_tasks")
+
     spec: TaskSpec
     control_task: PoeTask
     switch_tasks: dict[str, PoeTask]
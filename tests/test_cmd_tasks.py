@@ -173,6 +173,28 @@ def test_cmd_task_with_with_glob_arg_and_cwd(
     assert result.stderr == ""
 
 
+def test_cmd_task_with_repeated_glob_pattern(run_poe_subproc, temp_pyproject):
+    project_path = temp_pyproject(
+        """
+        [tool.poe.tasks]
+        echo-txt = "poe_test_echo *.txt mid *.txt"
+        """
+    )
+    project_path.joinpath("a.txt").touch()
+    project_path.joinpath("b.txt").touch()
+
+    result = run_poe_subproc("echo-txt", cwd=project_path)
+    assert result.code == 0
+    first_matches, mid, repeated_matches = result.stdout.partition(" mid ")
+    assert mid == " mid "
+    assert sorted(first_matches.split()) == [
+        str(project_path / "a.txt"),
+        str(project_path / "b.txt"),
+    ]
+    assert repeated_matches.split() == first_matches.split()
+    assert result.stderr == ""
+
+
 def test_cmd_with_capture_stdout(run_poe_subproc, projects, poe_project_path):
     result = run_poe_subproc(
         "-C",
@@ -1,3 +1,6 @@
+import sys
+
+
 def test_call_attr_func(run_poe_subproc):
     result = run_poe_subproc("deep-graph-with-args", project="graphs")
     assert result.capture == (
@@ -39,3 +42,49 @@ def test_task_graph_in_sequence(run_poe_subproc):
     )
     assert result.stdout == ("a1: A1, a2: A2\nb\n")
     assert result.stderr == ""
+
+
+def test_deep_task_graph_exceeding_recursion_limit(run_poe, temp_pyproject):
+    chain_length = sys.getrecursionlimit() + 100
+    project_path = temp_pyproject(
+        "[tool.poe.tasks]\n"
+        'task0 = "poe_test_echo 0"\n'
+        + "".join(
+            f'task{index} = {{ cmd = "poe_test_echo {index}", '
+            f'deps = ["task{index - 1}"] }}\n'
+            for index in range(1, chain_length)
+        )
+    )
+    result = run_poe("-d", f"task{chain_length - 1}", cwd=project_path)
+    assert result.code == 0
+    assert result.capture == "".join(
+        f"Poe => poe_test_echo {index}\n" for index in range(chain_length)
+    )
+
+
+def test_task_in_deps_and_uses_of_task_and_sibling(run_poe_subproc, temp_pyproject):
+    project_path = temp_pyproject(
+        """
+        [tool.poe.tasks]
+        _shared = "poe_test_echo shared"
+
+          [tool.poe.tasks.sibling]
+          cmd = "poe_test_echo sibling $shared"
+          deps = ["_shared"]
+          uses = { shared = "_shared" }
+
+          [tool.poe.tasks.main]
+          cmd = "poe_test_echo main $shared"
+          deps = ["_shared", "sibling"]
+          uses = { shared = "_shared" }
+        """
+    )
+    result = run_poe_subproc("main", cwd=project_path)
+    assert result.capture == (
+        "Poe => poe_test_echo shared\n"
+        "Poe <= poe_test_echo shared\n"
+        "Poe => poe_test_echo sibling shared\n"
+        "Poe => poe_test_echo main shared\n"
+    )
+    assert result.stdout == "shared\nsibling shared\nmain shared\n"
+    assert result.stderr == ""
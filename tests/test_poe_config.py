@@ -77,3 +77,76 @@ def test_decrease_verbosity(run_poe_subproc):
     assert result.capture == ""
     assert result.stdout == "Hello\n"
     result.assert_no_err()
+
+
+def test_task_name_with_non_ascii_characters(run_poe, temp_pyproject):
+    project_path = temp_pyproject(
+        """
+        [tool.poe.tasks]
+        "buildé" = "poe_test_echo hi"
+        """
+    )
+    result = run_poe("-d", "buildé", cwd=project_path)
+    assert result.code == 0
+    assert result.capture == "Poe => poe_test_echo hi\n"
+
+
+def test_task_name_with_trailing_newline_is_invalid(run_poe, temp_pyproject):
+    project_path = temp_pyproject(
+        """
+        [tool.poe.tasks]
+        "build\\n" = "poe_test_echo hi"
+        """
+    )
+    result = run_poe("-d", "build", cwd=project_path)
+    assert result.code == 1
+    assert (
+        "Error: Invalid task 'build\\n'\n"
+        "     | Task names characters must be alphanumeric, colon, underscore or "
+        "dash.\n"
+    ) in result.capture
+
+
+def test_uses_key_with_trailing_newline_is_invalid(run_poe, temp_pyproject):
+    project_path = temp_pyproject(
+        """
+        [tool.poe.tasks]
+        _dep = "poe_test_echo hi"
+
+        [tool.poe.tasks.build]
+        cmd = "poe_test_echo $out"
+        uses = { "out\\n" = "_dep" }
+        """
+    )
+    result = run_poe("-d", "build", cwd=project_path)
+    assert result.code == 1
+    assert (
+        "Error: Invalid task 'build'\n"
+        "     | 'uses' option includes invalid key: 'out\\n'\n"
+    ) in result.capture
+
+
+def test_task_name_starting_with_non_ascii_letter(run_poe, temp_pyproject):
+    project_path = temp_pyproject(
+        """
+        [tool.poe.tasks]
+        "déployer" = "poe_test_echo hi"
+        """
+    )
+    result = run_poe("-d", "déployer", cwd=project_path)
+    assert result.code == 0
+    assert result.capture == "Poe => poe_test_echo hi\n"
+
+
+def test_empty_task_name_is_invalid(run_poe, temp_pyproject):
+    project_path = temp_pyproject(
+        """
+        [tool.poe.tasks]
+        "" = "poe_test_echo hi"
+        """
+    )
+    result = run_poe("-d", "build", cwd=project_path)
+    assert result.code == 1
+    assert "Error: Task names must start with a letter or underscore.\n" in (
+        result.capture
+    )